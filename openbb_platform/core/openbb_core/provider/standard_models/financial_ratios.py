@@ -2,7 +2,14 @@
 
 from typing import Optional
 
-from pydantic import Field, NonNegativeInt, field_validator
+from pydantic import (
+    ConfigDict,
+    Field,
+    NonNegativeInt,
+    StringConstraints,
+    field_validator,
+)
+from typing_extensions import Annotated
 
 from openbb_core.provider.abstract.data import Data
 from openbb_core.provider.abstract.query_params import QueryParams
@@ -11,24 +18,23 @@ from openbb_core.provider.utils.descriptions import (
     QUERY_DESCRIPTIONS,
 )
 
+SYMBOL_DESCRIPTION = QUERY_DESCRIPTIONS.get("symbol", "")
+PERIOD_DESCRIPTION = QUERY_DESCRIPTIONS.get("period", "")
+LIMIT_DESCRIPTION = QUERY_DESCRIPTIONS.get("limit", "")
+DATE_DESCRIPTION = DATA_DESCRIPTIONS.get("date", "")
+
 
 class FinancialRatiosQueryParams(QueryParams):
     """Financial Ratios Query."""
 
-    symbol: str = Field(description=QUERY_DESCRIPTIONS.get("symbol", ""))
-    period: str = Field(
-        default="annual", description=QUERY_DESCRIPTIONS.get("period", "")
-    )
-    limit: NonNegativeInt = Field(
-        default=12, description=QUERY_DESCRIPTIONS.get("limit", "")
+    symbol: Annotated[str, StringConstraints(to_upper=True)] = Field(
+        description=SYMBOL_DESCRIPTION
     )
+    period: str = Field(default="annual", description=PERIOD_DESCRIPTION)
+    limit: NonNegativeInt = Field(default=12, description=LIMIT_DESCRIPTION)
 
-    @field_validator("symbol", mode="before", check_fields=False)
-    @classmethod
-    def to_upper(cls, v: str):
-        """Convert field to uppercase."""
-        return v.upper()
-
+    # Providers narrow `period` to a Literal, so this stays a validator
+    # to keep lowercasing the input before it's checked against their choices.
     @field_validator("period", mode="before", check_fields=False)
     @classmethod
     def to_lower(cls, v: Optional[str]) -> Optional[str]:
@@ -39,6 +45,10 @@ class FinancialRatiosQueryParams(QueryParams):
 class FinancialRatiosData(Data):
     """Financial Ratios Standard Model."""
 
-    period_ending: str = Field(description=DATA_DESCRIPTIONS.get("date", ""))
+    # Provider models add dozens of ratio fields on top of this one, so we only
+    # build their validators the first time a row is actually constructed.
+    model_config = ConfigDict(defer_build=True)
+
+    period_ending: str = Field(description=DATE_DESCRIPTION)
     fiscal_period: str = Field(description="Period of the financial ratios.")
     fiscal_year: Optional[int] = Field(default=None, description="Fiscal year.")
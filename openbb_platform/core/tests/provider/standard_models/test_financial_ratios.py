@@ -0,0 +1,17 @@
+"""Test the financial ratios standard model."""
+
+from openbb_core.provider.standard_models.financial_ratios import (
+    FinancialRatiosQueryParams,
+)
+
+
+def test_financial_ratios_query_params_symbol():
+    """Test the symbol is uppercased."""
+    params = FinancialRatiosQueryParams(symbol="aapl")
+    assert params.symbol == "AAPL"
+
+
+def test_financial_ratios_query_params_period():
+    """Test the period is lowercased."""
+    params = FinancialRatiosQueryParams(symbol="AAPL", period="Annual")
+    assert params.period == "annual"
@@ -3,26 +3,37 @@
 import asyncio
 import atexit
 import json
+import mmap
 import os
 import re
 import subprocess
 import sys
 import warnings
+from datetime import date, datetime, timedelta, timezone
+from functools import lru_cache
 from multiprocessing import current_process
 from pathlib import Path
-from threading import Thread
-from typing import TYPE_CHECKING, Any, Dict, Optional, Union
+from threading import Event, Lock, Thread
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional, Union
 
-import aiohttp
-import pandas as pd
-import plotly.graph_objects as go
 from openbb_core.env import Env
 from packaging import version
 
+from openbb_charting.core.file_watcher import wait_for_file
+
 if TYPE_CHECKING:
+    import aiohttp
+    import numpy as np
+    import pandas as pd
+    import plotly.graph_objects as go
     from openbb_core.app.model.charts.charting_settings import ChartingSettings
 
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
 # pylint: disable=C0415
 try:
     from pywry import PyWry
@@ -53,17 +64,228 @@ else:
 
 PLOTS_CORE_PATH = Path(__file__).parent.resolve()
 PLOTLYJS_PATH = PLOTS_CORE_PATH / "assets" / "plotly-2.32.0.min.js"
+PLOTLYJS_URL = f"https://cdn.plot.ly/{PLOTLYJS_PATH.name}"
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+DOWNLOAD_PARTS = 4
+MIN_PYWRY_VERSION = version.parse("0.5.12")
 BACKEND = None
+_BACKEND_LOCK = Lock()
 
+# Set once the plotly.js download, if any, has finished
+_DOWNLOAD_EVENT = Event()
+DOWNLOAD_TIMEOUT = 30
 
-class Backend(PyWry):
-    """Custom backend for Plotly."""
+HTML_TAG_RE = re.compile(r"<[^>]*>")
+MARKDOWN_TAG_RE = re.compile(r"\[\/?[a-z]+\]")
+
+
+def _strip_html_tags(text: str) -> str:
+    """Remove any html tags from the text, most titles don't have any."""
+    return HTML_TAG_RE.sub("", text) if "<" in text else text
+
+
+@lru_cache(maxsize=None)
+def _get_json_default() -> Callable[[Any], Any]:
+    """Get the hook serializing the objects orjson can't handle natively.
+
+    The hook runs for every such cell, e.g. pd.NA or pd.Timestamp in object
+    columns, so pandas is imported here once instead of inside it.
+    """
+    import pandas as pd  # pylint: disable=import-outside-toplevel
+
+    is_scalar, isna = pd.api.types.is_scalar, pd.isna
+
+    def json_default(obj: Any) -> Any:
+        if is_scalar(obj) and isna(obj):
+            return None
+        if isinstance(obj, datetime):
+            return _datetime_to_iso(obj)
+        if isinstance(obj, date):
+            return f"{obj.isoformat()}T00:00:00.000"
+        if isinstance(obj, timedelta):
+            return _timedelta_to_iso(pd.Timedelta(obj))
+        if hasattr(obj, "isoformat"):
+            return obj.isoformat()
+        return str(obj)
+
+    return json_default
+
+
+def _dumps_json(data: Any) -> str:
+    """Serialize data to a JSON string, using orjson when available."""
+    default = _get_json_default()
+    if orjson is None:
+        return json.dumps(data, default=default)
+    # dates are passed to the hook so they're formatted like pandas does
+    return orjson.dumps(
+        data,
+        default=default,
+        option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_PASSTHROUGH_DATETIME,
+    ).decode()
+
+
+def _get_column_widths(df_table: "pd.DataFrame") -> "np.ndarray":
+    """Get the max length of each column's name and values as its width.
+
+    Integer and boolean columns are measured from their extremes, so only
+    the remaining columns are converted to strings.
+    """
+    # pylint: disable=import-outside-toplevel
+    import numpy as np
+    import pandas as pd
+
+    widths = np.fromiter(
+        (len(str(name)) for name in df_table.columns),
+        dtype=np.int64,
+        count=len(df_table.columns),
+    )
+    if df_table.empty:
+        return widths
+
+    for i, (_, col) in enumerate(df_table.items()):
+        if pd.api.types.is_bool_dtype(col):
+            values_len = 5 if not col.all() else 4
+        elif pd.api.types.is_integer_dtype(col):
+            values_len = max(len(str(col.max())), len(str(col.min())))
+            if col.hasnans:
+                # nullable integers are stringified as "<NA>" when missing
+                values_len = max(values_len, len(str(pd.NA)))
+        else:
+            values_len = col.astype(str).str.len().max()
+        widths[i] = max(widths[i], values_len)
+
+    return widths
+
+
+def _get_figure_dict(fig: "go.Figure", paper_bgcolor: str) -> Dict[str, Any]:
+    """Get the figure dict without the deep copy `fig.to_dict()` makes.
+
+    Only the containers we change are copied, the trace values are shared
+    with the figure and get converted once when encoded.
+    """
+    # pylint: disable=protected-access
+    fig_dict: Dict[str, Any] = {
+        "data": [
+            {key: value for key, value in trace.items() if key != "uid"}
+            for trace in fig._data
+        ],
+        "layout": dict(fig._layout, paper_bgcolor=paper_bgcolor),
+    }
+    frames = [frame._props for frame in fig._frame_objs]
+    if frames:
+        fig_dict["frames"] = frames
+
+    return fig_dict
+
+
+def _datetime_to_iso(value: datetime) -> str:
+    """Format a datetime like `to_json(date_format="iso")` does."""
+    if value.tzinfo is None:
+        return value.isoformat(timespec="milliseconds")
+    utc = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return utc.isoformat(timespec="milliseconds") + "Z"
+
+
+def _timedelta_to_iso(value: "pd.Timedelta") -> str:
+    """Format a timedelta like `to_json(date_format="iso")` does.
+
+    The fraction of a second is written in groups of 3 digits, down to the
+    smallest non-zero unit, e.g. "P0DT0H0M1.500S".
+    """
+    parts = value.components
+    seconds = str(parts.seconds)
+    if parts.nanoseconds:
+        seconds += (
+            f".{parts.milliseconds:03d}{parts.microseconds:03d}{parts.nanoseconds:03d}"
+        )
+    elif parts.microseconds:
+        seconds += f".{parts.milliseconds:03d}{parts.microseconds:03d}"
+    elif parts.milliseconds:
+        seconds += f".{parts.milliseconds:03d}"
+    return f"P{parts.days}DT{parts.hours}H{parts.minutes}M{seconds}S"
+
+
+def _datetimes_to_iso(values: Union["pd.Series", "pd.Index"]) -> "np.ndarray":
+    """Format datetimes like `to_json(date_format="iso")` does, with NaT as None."""
+    # pylint: disable=import-outside-toplevel
+    import numpy as np
+    import pandas as pd
+
+    dates = pd.DatetimeIndex(values)
+    is_aware = dates.tz is not None
+    if is_aware:
+        dates = dates.tz_convert(None)
+
+    iso = np.datetime_as_string(dates.to_numpy(), unit="ms").astype(object)
+    if is_aware:
+        iso += "Z"
+    iso[dates.isna()] = None
+    return iso
+
+
+def _get_iso_values(values: Union["pd.Series", "pd.Index"]) -> Optional["np.ndarray"]:
+    """Format datetime64 values or plain `datetime.date` objects in one pass.
+
+    timedelta64 values are formatted here too, since pandas would give them
+    to orjson as nanosecond ints. None is returned for anything else, e.g.
+    dates mixed with datetimes or out of bounds dates, and the json default
+    hook formats them one by one.
+    """
+    # pylint: disable=import-outside-toplevel
+    import numpy as np
+    import pandas as pd
+
+    if values.dtype.kind == "m":
+        return np.array(
+            [None if pd.isna(value) else _timedelta_to_iso(value) for value in values],
+            dtype=object,
+        )
+
+    if not pd.api.types.is_datetime64_any_dtype(values) and not (
+        # a date column after reset_index() is an object column of datetime.date
+        values.dtype == object
+        and pd.api.types.infer_dtype(values, skipna=True) == "date"
+        # datetimes and Timestamps infer as dates too, but converting them
+        # together would localize the plain dates to their timezone
+        and not any(isinstance(value, datetime) for value in values)
+    ):
+        return None
+
+    try:
+        return _datetimes_to_iso(values)
+    except ValueError:
+        return None
+
+
+def _get_table_split(df_table: "pd.DataFrame") -> Dict[str, Any]:
+    """Build the `orient="split"` dict of the DataFrame for orjson to encode.
+
+    Datetime, date and timedelta columns and index are formatted in one pass
+    each, everything else is left for orjson and the json default hook.
+    """
+    iso_cols = {}
+    for i, (_, col) in enumerate(df_table.items()):
+        iso = _get_iso_values(col)
+        if iso is not None:
+            iso_cols[i] = iso
 
-    def __new__(cls, *args, **kwargs):  # pylint: disable=W0613
-        """Create a singleton instance of the backend."""
-        if not hasattr(cls, "instance"):
-            cls.instance = super().__new__(cls)  # pylint: disable=E1120
-        return cls.instance
+    if iso_cols:
+        values = df_table.to_numpy(dtype=object)
+        for i, iso in iso_cols.items():
+            values[:, i] = iso
+    else:
+        values = df_table.to_numpy()
+
+    index = _get_iso_values(df_table.index)
+    return dict(
+        columns=df_table.columns.tolist(),
+        index=(index if index is not None else df_table.index).tolist(),
+        data=values.tolist(),
+    )
+
+
+class Backend(PyWry):  # pylint: disable=R0902
+    """Custom backend for Plotly."""
 
     def __init__(
         self,
@@ -94,16 +316,56 @@ class Backend(PyWry):
             self.isatty = False
 
         self.WIDTH, self.HEIGHT = 1400, 762
+        self._window_settings: Optional[tuple] = None
+        self._html_checked: Dict[Path, bool] = {}
+        self._pywry_version: Optional[version.Version] = None
+
+        icon_path = PLOTS_CORE_PATH / "assets" / "Terminal_icon.png"
+        self._window_icon: Optional[Path] = icon_path if icon_path.exists() else None
+        # Windows opens exports with os.startfile instead
+        self._opener = "open" if sys.platform == "darwin" else "xdg-open"
+        self._outgoing_template: Dict[str, Any] = {
+            "icon": self._window_icon,
+            "download_path": str(self.charting_settings.user_exports_directory),
+        }
         self.logged_in: bool = False
+        self._base_json_update: Optional[Dict[str, Any]] = None
+        self._chart_style: Optional[str] = None
+        self._paper_bg: str = ""
 
         atexit.register(self.close)
 
     def set_window_dimensions(self):
         """Set the window dimensions."""
+        window_settings = (
+            self.charting_settings.plot_pywry_width,
+            self.charting_settings.plot_pywry_height,
+        )
+        if window_settings == self._window_settings:
+            return
+
         width = self.charting_settings.plot_pywry_width or 1400
         height = self.charting_settings.plot_pywry_height or 762
 
         self.WIDTH, self.HEIGHT = int(width), int(height)
+        self._window_settings = window_settings
+
+    def _sync_chart_style(self):
+        """Update the theme dependent values if the chart style has changed."""
+        chart_style = self.charting_settings.chart_style
+        if chart_style == self._chart_style:
+            return
+
+        self._chart_style = chart_style
+        self._paper_bg = (
+            "rgba(0,0,0,0)" if chart_style == "dark" else "rgba(255,255,255,0)"
+        )
+
+    def _html_exists(self, html: Path) -> bool:
+        """Check if the html file exists, only hitting the filesystem until it does."""
+        if not self._html_checked.get(html, False):
+            self._html_checked[html] = html.exists()
+        return self._html_checked[html]
 
     def get_pending(self) -> list:
         """Get the pending data that has not been sent to the backend."""
@@ -115,8 +377,10 @@ class Backend(PyWry):
 
     def get_plotly_html(self) -> Path:
         """Get the plotly html file."""
+        if not PLOTLYJS_PATH.exists():
+            _DOWNLOAD_EVENT.wait(timeout=DOWNLOAD_TIMEOUT)
         self.set_window_dimensions()
-        if self.plotly_html.exists():
+        if self._html_exists(self.plotly_html):
             return self.plotly_html
 
         warnings.warn(
@@ -129,7 +393,7 @@ class Backend(PyWry):
     def get_table_html(self) -> Path:
         """Get the table html file."""
         self.set_window_dimensions()
-        if self.table_html.exists():
+        if self._html_exists(self.table_html):
             return self.table_html
         warnings.warn(
             "[bold red]table.html file not found, check the path:[/]"
@@ -140,10 +404,7 @@ class Backend(PyWry):
 
     def get_window_icon(self) -> Optional[Path]:
         """Get the window icon."""
-        icon_path = PLOTS_CORE_PATH / "assets" / "Terminal_icon.png"
-        if icon_path.exists():
-            return icon_path
-        return None
+        return self._window_icon
 
     def get_json_update(
         self,
@@ -151,33 +412,40 @@ class Backend(PyWry):
         theme: Optional[str] = None,
     ) -> dict:
         """Get the json update for the backend."""
-        posthog: Dict[str, Any] = dict(collect_logs=self.charting_settings.log_collect)
+        # The settings and versions don't change after startup, so we only
+        # build the static part of the update once. We can't do it in __init__
+        # because PyWry.__version__ might only be set by check_backend.
+        if self._base_json_update is None:
+            self._base_json_update = dict(
+                log_id=self.charting_settings.app_id,
+                pywry_version=self.__version__,
+                platform_version=self.charting_settings.version,
+                python_version=self.charting_settings.python_version,
+                posthog=dict(collect_logs=self.charting_settings.log_collect),
+            )
+
+        self._sync_chart_style()
+        json_update = self._base_json_update.copy()
+        json_update["theme"] = theme or self._chart_style
+        json_update["command_location"] = cmd_loc
+
         if (
             self.charting_settings.log_collect
             and self.charting_settings.user_uuid
             and not self.logged_in
         ):
             self.logged_in = True
-            posthog.update(
-                dict(
-                    user_id=self.charting_settings.user_uuid,
-                    email=self.charting_settings.user_email,
-                )
+            json_update["posthog"] = dict(
+                json_update["posthog"],
+                user_id=self.charting_settings.user_uuid,
+                email=self.charting_settings.user_email,
             )
 
-        return dict(
-            theme=theme or self.charting_settings.chart_style,
-            log_id=self.charting_settings.app_id,
-            pywry_version=self.__version__,
-            platform_version=self.charting_settings.version,
-            python_version=self.charting_settings.python_version,
-            posthog=posthog,
-            command_location=cmd_loc,
-        )
+        return json_update
 
     def send_figure(
         self,
-        fig: go.Figure,
+        fig: "go.Figure",
         export_image: Optional[Union[Path, str]] = "",
         command_location: Optional[str] = "",
     ):
@@ -193,31 +461,32 @@ class Backend(PyWry):
             Location of the command, by default "".
             We can use the route here to display it on the chart title.
         """
-        self.check_backend()
         # pylint: disable=C0415
+        import plotly.io as pio
 
-        paper_bg = (
-            "rgba(0,0,0,0)"
-            if self.charting_settings.chart_style == "dark"
-            else "rgba(255,255,255,0)"
-        )
-        title = "Interactive Chart"
-        fig.layout.title.text = re.sub(
-            r"<[^>]*>", "", fig.layout.title.text if fig.layout.title.text else title
-        )
+        self.check_backend()
+        self._sync_chart_style()
+
+        title = _strip_html_tags(fig.layout.title.text or "Interactive Chart")
+        fig.layout.title.text = title
         fig.layout.height += 69
 
         export_image = Path(export_image).resolve() if export_image else None
 
-        json_data = json.loads(fig.to_json())
-        json_data.update(self.get_json_update(command_location))
-        json_data["layout"]["paper_bgcolor"] = paper_bg
+        fig_dict = _get_figure_dict(fig, self._paper_bg)
+        fig_dict.update(self.get_json_update(command_location))
 
-        outgoing = dict(
+        # PyWry encodes json_data with the stdlib json module, so numpy arrays
+        # and dates are converted to plain JSON types here
+        json_data = (orjson or json).loads(
+            pio.json.to_json_plotly(fig_dict, engine="orjson" if orjson else "json")
+        )
+
+        outgoing = self.get_kwargs(command_location)
+        outgoing.update(
             html=self.get_plotly_html(),
             json_data=json_data,
             export_image=export_image,
-            **self.get_kwargs(command_location),
         )
         self.send_outgoing(outgoing)
 
@@ -233,26 +502,18 @@ class Backend(PyWry):
         """Check if the image has been exported to the path."""
         img_path = export_image.resolve()
 
-        checks = 0
-        while not img_path.exists():
-            await asyncio.sleep(0.2)
-            checks += 1
-            if checks > 50:
-                break
-
-        if img_path.exists():  # noqa: SIM102
+        if await wait_for_file(img_path, timeout=10):  # noqa: SIM102
             if self.charting_settings.plot_open_export:
                 if sys.platform == "win32":
                     os.startfile(export_image)  # nosec: B606 # noqa: S606
                 else:
-                    opener = "open" if sys.platform == "darwin" else "xdg-open"
                     subprocess.check_call(
-                        [opener, export_image]  # nosec: B603 # noqa: S603
+                        [self._opener, export_image]  # nosec: B603 # noqa: S603
                     )
 
     def send_table(
         self,
-        df_table: pd.DataFrame,
+        df_table: "pd.DataFrame",
         title: str = "",
         source: str = "",
         theme: str = "dark",
@@ -275,29 +536,26 @@ class Backend(PyWry):
 
         if title:
             # We remove any html tags and markdown from the title
-            title = re.sub(r"<[^>]*>", "", title)
-            title = re.sub(r"\[\/?[a-z]+\]", "", title)
+            title = _strip_html_tags(title)
+            if "[" in title:
+                title = MARKDOWN_TAG_RE.sub("", title)
 
         # we get the length of each column using the max length of the column
         # name and the max length of the column values as the column width
-        columnwidth = [
-            max(
-                len(str(df_table[col].name)),
-                df_table[col].astype(str).str.len().max(),
-            )
-            for col in df_table.columns
-            if hasattr(df_table[col], "name") and hasattr(df_table[col], "dtype")
-        ]
+        columnwidth = _get_column_widths(df_table)
 
         # we add a percentage of max to the min column width
-        columnwidth = [
-            int(x + (max(columnwidth) - min(columnwidth)) * 0.2) for x in columnwidth
-        ]
+        if columnwidth.size:
+            columnwidth += int((columnwidth.max() - columnwidth.min()) * 0.2)
 
         # in case of a very small table we set a min width
-        width = max(int(min(sum(columnwidth) * 9.7, self.WIDTH + 100)), 800)
+        width = max(int(min(columnwidth.sum() * 9.7, self.WIDTH + 100)), 800)
 
-        json_data = json.loads(df_table.to_json(orient="split", date_format="iso"))
+        if orjson is None:
+            json_data = json.loads(df_table.to_json(orient="split", date_format="iso"))
+        else:
+            # orjson encodes NaN as null, so we can skip the pandas roundtrip
+            json_data = _get_table_split(df_table)
         json_data.update(
             dict(
                 title=title,
@@ -306,12 +564,12 @@ class Backend(PyWry):
             )
         )
 
-        outgoing = dict(
+        outgoing = self.get_kwargs(command_location)
+        outgoing.update(
             html=self.get_table_html(),
-            json_data=json.dumps(json_data),
+            json_data=_dumps_json(json_data),
             width=width,
             height=self.HEIGHT - 100,
-            **self.get_kwargs(command_location),
         )
         self.send_outgoing(outgoing)
 
@@ -341,21 +599,23 @@ class Backend(PyWry):
             window.location.replace("{url}");
         </script>
         """
-        outgoing = dict(
+        outgoing = self.get_kwargs(title)
+        outgoing.update(
             html=script,
-            **self.get_kwargs(title),
             width=width or self.WIDTH,
             height=height or self.HEIGHT,
         )
         self.send_outgoing(outgoing)
 
     def get_kwargs(self, title: Optional[str] = "") -> dict:
-        """Get the kwargs for the backend."""
-        return {
-            "title": "OpenBB Platform" + (f" - {title}" if title else ""),
-            "icon": self.get_window_icon(),
-            "download_path": str(self.charting_settings.user_exports_directory),
-        }
+        """Get the kwargs for the backend.
+
+        A new dict is returned on every call, since send_outgoing may queue it.
+        """
+        return dict(
+            self._outgoing_template,
+            title="OpenBB Platform" + (f" - {title}" if title else ""),
+        )
 
     def start(self, debug: bool = False, headless: bool = False):
         """Start the backend WindowManager process."""
@@ -372,21 +632,25 @@ class Backend(PyWry):
             "OpenBB Plots backend.[/]\n"
             "[yellow]Please update pywry with 'pip install pywry --upgrade'[/]"
         )
-        if not hasattr(PyWry, "__version__"):
-            try:
-                # pylint: disable=C0415
-                from pywry import __version__ as pywry_version
-            except ImportError:
-                self.max_retries = 0
-                return warnings.warn(message)
+        if self._pywry_version is None:
+            if not hasattr(PyWry, "__version__"):
+                try:
+                    # pylint: disable=C0415
+                    from pywry import __version__ as pywry_version
+                except ImportError:
+                    self.max_retries = 0
+                    return warnings.warn(message)
 
-            PyWry.__version__ = pywry_version  # pylint: disable=W0201
+                PyWry.__version__ = pywry_version  # pylint: disable=W0201
 
-        if version.parse(PyWry.__version__) < version.parse("0.5.12"):
+            # The installed version can't change at runtime, so we parse it once
+            self._pywry_version = version.parse(PyWry.__version__)
+
+        if self._pywry_version < MIN_PYWRY_VERSION:
             self.max_retries = 0  # pylint: disable=W0201
             return warnings.warn(message)
 
-        if version.parse(PyWry.__version__) > version.parse("0.5.12"):
+        if self._pywry_version > MIN_PYWRY_VERSION:
             return super().check_backend()
 
         try:
@@ -402,35 +666,121 @@ class Backend(PyWry):
         super().close()
 
 
+async def _download_stream(session: "aiohttp.ClientSession", url: str, path: Path):
+    """Download the url to path in a single stream."""
+    # the file writes are run in the executor so they don't block the loop
+    loop = asyncio.get_running_loop()
+    async with session.get(url) as resp:
+        resp.raise_for_status()
+        with open(str(path), "wb") as f:
+            async for chunk in resp.content.iter_chunked(DOWNLOAD_CHUNK_SIZE):
+                await loop.run_in_executor(None, f.write, chunk)
+
+
+async def _download_range(
+    session: "aiohttp.ClientSession", url: str, start: int, end: int, buffer: mmap.mmap
+):
+    """Download the inclusive byte range of the url into the buffer."""
+    headers = {"Range": f"bytes={start}-{end}", "Accept-Encoding": "identity"}
+    async with session.get(url, headers=headers) as resp:
+        if resp.status != 206:
+            raise ValueError(f"Range request returned status {resp.status}")
+        offset = start
+        async for chunk in resp.content.iter_chunked(DOWNLOAD_CHUNK_SIZE):
+            if offset + len(chunk) > end + 1:
+                raise ValueError("Range request returned too many bytes")
+            buffer[offset : offset + len(chunk)] = chunk
+            offset += len(chunk)
+
+    if offset != end + 1:
+        raise ValueError("Range request returned too few bytes")
+
+
+async def _download_ranges(
+    session: "aiohttp.ClientSession", url: str, path: Path, length: int
+):
+    """Download the url to path in DOWNLOAD_PARTS parallel byte ranges."""
+    part_size = -(-length // DOWNLOAD_PARTS)
+    with open(str(path), "w+b") as f:
+        f.truncate(length)
+        with mmap.mmap(f.fileno(), length) as buffer:
+            tasks = [
+                asyncio.ensure_future(
+                    _download_range(
+                        session, url, start, min(start + part_size, length) - 1, buffer
+                    )
+                )
+                for start in range(0, length, part_size)
+            ]
+            try:
+                await asyncio.gather(*tasks)
+            except BaseException:
+                # the other parts can't keep writing once the buffer is closed
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+                raise
+            buffer.flush()
+
+
 async def download_plotly_js():
     """Download or updates plotly.js to the assets folder."""
     js_filename = PLOTLYJS_PATH.name
+    url = PLOTLYJS_URL
+    tmp_path: Optional[Path] = None
     try:
+        import aiohttp  # pylint: disable=import-outside-toplevel
+
+        # we download to a temporary file and move it into place when it's complete,
+        # so readers and later runs never see a partially written plotly.js
+        tmp_path = PLOTLYJS_PATH.with_name(f".{js_filename}.{os.getpid()}.part")
+
         # we use aiohttp to download plotly.js
         # this is so we don't have to block the main thread
         async with aiohttp.ClientSession(
-            connector=aiohttp.TCPConnector(verify_ssl=False)
-        ) as session, session.get(f"https://cdn.plot.ly/{js_filename}") as resp:
-            with open(str(PLOTLYJS_PATH), "wb") as f:
-                while True:
-                    chunk = await resp.content.read(1024)
-                    if not chunk:
-                        break
-                    f.write(chunk)
+            connector=aiohttp.TCPConnector(ssl=False, limit=DOWNLOAD_PARTS)
+        ) as session:
+            # ranges are over the encoded bytes, so we ask for the raw file
+            identity = {"Accept-Encoding": "identity"}
+            async with session.head(
+                url, headers=identity, allow_redirects=True
+            ) as resp:
+                length = int(resp.headers.get("Content-Length", 0))
+                accept_ranges = resp.headers.get("Accept-Ranges", "none")
+
+            downloaded = False
+            if accept_ranges == "bytes" and length > DOWNLOAD_CHUNK_SIZE:
+                try:
+                    await _download_ranges(session, url, tmp_path, length)
+                    downloaded = True
+                except (aiohttp.ClientError, asyncio.TimeoutError, ValueError):
+                    # a stalled or misbehaving part is retried as a single stream
+                    pass
+
+            if not downloaded:
+                await _download_stream(session, url, tmp_path)
+
+        os.replace(tmp_path, PLOTLYJS_PATH)
 
         # We delete the old version of plotly.js
-        for file in (PLOTS_CORE_PATH / "assets").glob("plotly*.js"):
+        for file in PLOTLYJS_PATH.parent.glob("plotly*.js"):
             if file.name != js_filename:
                 file.unlink(missing_ok=True)
 
     except Exception as err:  # pylint: disable=W0703
         warnings.warn(f"Error downloading plotly.js: {err}")
+    finally:
+        if tmp_path is not None:
+            tmp_path.unlink(missing_ok=True)
+        _DOWNLOAD_EVENT.set()
 
 
 # To avoid having plotly.js in the repo, we download it if it's not present
 if not PLOTLYJS_PATH.exists() and not JUPYTER_NOTEBOOK:
     # We run this in a thread so we don't block the main thread
     Thread(target=asyncio.run, args=(download_plotly_js(),)).start()
+else:
+    _DOWNLOAD_EVENT.set()
 
 
 def create_backend(charting_settings: Optional["ChartingSettings"] = None):
@@ -438,10 +788,15 @@ def create_backend(charting_settings: Optional["ChartingSettings"] = None):
     # # pylint: disable=import-outside-toplevel
     from openbb_core.app.model.charts.charting_settings import ChartingSettings
 
-    charting_settings = charting_settings or ChartingSettings()
     global BACKEND  # pylint: disable=W0603 # noqa
-    if BACKEND is None:
-        BACKEND = Backend(charting_settings)
+    if BACKEND is not None:
+        return
+
+    # Dashboards can create the backend from several threads at once,
+    # so we make sure only one of them starts the PyWry process
+    with _BACKEND_LOCK:
+        if BACKEND is None:
+            BACKEND = Backend(charting_settings or ChartingSettings())
 
 
 def get_backend() -> Backend:
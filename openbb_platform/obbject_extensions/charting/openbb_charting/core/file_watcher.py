@@ -0,0 +1,157 @@
+"""Wait for files to appear using OS-level directory notifications."""
+
+import asyncio
+import ctypes
+import ctypes.util
+import os
+import select
+import sys
+from pathlib import Path
+from typing import Any, Optional
+
+# inotify(7) event masks
+IN_CREATE = 0x00000100
+IN_MOVED_TO = 0x00000080
+
+
+class DirectoryWatcher:
+    """Selectable handle that becomes readable when a directory changes.
+
+    Uses inotify on Linux and kqueue on macOS/BSD. Raises OSError when
+    neither is available, so callers can fall back to polling.
+    """
+
+    def __init__(self, directory: Path):
+        """Start watching the directory."""
+        self._fd: int = -1
+        self._dir_fd: Optional[int] = None
+        # select.kqueue only exists on macOS/BSD, so it can't be named here
+        self._kqueue: Optional[Any] = None
+
+        if sys.platform.startswith("linux"):
+            self._init_inotify(directory)
+        elif hasattr(select, "kqueue"):
+            self._init_kqueue(directory)
+        else:
+            raise OSError(f"Directory notifications not supported on {sys.platform}")
+
+    def _init_inotify(self, directory: Path):
+        """Create an inotify instance watching for new entries."""
+        libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if fd < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, os.strerror(errno))
+
+        mask = IN_CREATE | IN_MOVED_TO
+        if libc.inotify_add_watch(fd, os.fsencode(directory), mask) < 0:
+            errno = ctypes.get_errno()
+            os.close(fd)
+            raise OSError(errno, os.strerror(errno), str(directory))
+
+        self._fd = fd
+
+    def _init_kqueue(self, directory: Path):
+        """Create a kqueue watching the directory for writes."""
+        # pylint: disable=no-member
+        self._dir_fd = os.open(directory, os.O_RDONLY)
+        kqueue = select.kqueue()  # type: ignore[attr-defined]
+        kevent = select.kevent(  # type: ignore[attr-defined]
+            self._dir_fd,
+            filter=select.KQ_FILTER_VNODE,  # type: ignore[attr-defined]
+            flags=select.KQ_EV_ADD | select.KQ_EV_CLEAR,  # type: ignore[attr-defined]
+            fflags=select.KQ_NOTE_WRITE,  # type: ignore[attr-defined]
+        )
+        kqueue.control([kevent], 0)
+        self._kqueue = kqueue
+        self._fd = kqueue.fileno()
+
+    def fileno(self) -> int:
+        """Get the file descriptor to select on."""
+        return self._fd
+
+    def drain(self):
+        """Consume the pending notifications."""
+        if self._kqueue is not None:
+            self._kqueue.control(None, 16, 0)
+            return
+
+        try:
+            while os.read(self._fd, 4096):
+                pass
+        except BlockingIOError:
+            pass
+
+    def close(self):
+        """Stop watching the directory."""
+        if self._kqueue is not None:
+            self._kqueue.close()
+        elif self._fd >= 0:
+            os.close(self._fd)
+        if self._dir_fd is not None:
+            os.close(self._dir_fd)
+        self._fd = -1
+
+
+async def poll_for_file(file_path: Path, timeout: float = 10.0) -> bool:
+    """Poll until the file exists or the timeout expires."""
+    checks = 0
+    while not file_path.exists():
+        await asyncio.sleep(0.2)
+        checks += 1
+        if checks > timeout / 0.2:
+            break
+
+    return file_path.exists()
+
+
+async def wait_for_file(file_path: Path, timeout: float = 10.0) -> bool:
+    """Wait until the file exists or the timeout expires.
+
+    Parameters
+    ----------
+    file_path : Path
+        Path of the file to wait for.
+    timeout : float, optional
+        Maximum number of seconds to wait, by default 10.0
+
+    Returns
+    -------
+    bool
+        Whether the file exists.
+    """
+    loop = asyncio.get_running_loop()
+    try:
+        watcher = DirectoryWatcher(file_path.parent)
+    except (OSError, AttributeError):
+        return await poll_for_file(file_path, timeout)
+
+    changed = asyncio.Event()
+
+    def on_change():
+        watcher.drain()
+        changed.set()
+
+    try:
+        try:
+            loop.add_reader(watcher.fileno(), on_change)
+        except NotImplementedError:
+            return await poll_for_file(file_path, timeout)
+
+        deadline = loop.time() + timeout
+        try:
+            while True:
+                changed.clear()
+                if file_path.exists():
+                    return True
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    return False
+                try:
+                    await asyncio.wait_for(changed.wait(), remaining)
+                except asyncio.TimeoutError:
+                    return file_path.exists()
+        finally:
+            loop.remove_reader(watcher.fileno())
+    finally:
+        watcher.close()
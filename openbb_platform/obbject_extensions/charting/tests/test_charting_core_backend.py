@@ -0,0 +1,336 @@
+"""Test the charting core backend helpers."""
+
+import asyncio
+import json
+from datetime import date, datetime, timezone
+from decimal import Decimal
+
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+import plotly.io as pio
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+from openbb_charting.core import backend
+from openbb_charting.core.backend import (
+    _dumps_json,
+    _get_column_widths,
+    _get_figure_dict,
+    _get_table_split,
+)
+
+# pylint: disable=protected-access, redefined-outer-name
+
+PLOTLY_JS = bytes(range(256)) * 1300
+
+
+def old_column_widths(df: pd.DataFrame) -> list:
+    """Get the column widths the way send_table used to, by stringifying every cell."""
+    return [
+        max(
+            len(str(df[col].name)),
+            df[col].astype(str).str.len().max(),
+        )
+        for col in df.columns
+        if hasattr(df[col], "name") and hasattr(df[col], "dtype")
+    ]
+
+
+@pytest.mark.parametrize(
+    "df",
+    [
+        pd.DataFrame({"a": [1, -12345, 3]}),
+        pd.DataFrame({"long_column_name": [-1, 0, 1]}),
+        pd.DataFrame({"flag": [True, True]}),
+        pd.DataFrame({"flag": [True, False]}),
+        pd.DataFrame({"flag": pd.array([True, None], dtype="boolean")}),
+        pd.DataFrame({"flag": pd.array([None, None], dtype="boolean")}),
+        pd.DataFrame({"n": pd.array([1, None, 3], dtype="Int64")}),
+        pd.DataFrame({"n": pd.array([None, None], dtype="Int64")}),
+        pd.DataFrame({"x": [1.5, float("nan"), -123.456]}),
+        pd.DataFrame({"s": ["a", None, "abcdefgh"]}),
+        pd.DataFrame({"d": pd.to_datetime(["2024-01-01", None])}),
+        pd.DataFrame({"a": pd.Series([], dtype="int64"), "bb": []}),
+        pd.DataFrame(
+            {
+                "int": [1, 2],
+                "float": [0.1, 2.25],
+                "str": ["x", "yy"],
+                "bool": [False, True],
+            }
+        ),
+    ],
+)
+def test_get_column_widths(df):
+    """Test the column widths match stringifying every cell."""
+    assert _get_column_widths(df).tolist() == old_column_widths(df)
+
+
+def test_get_column_widths_duplicate_columns():
+    """Test duplicate column names get a width each.
+
+    The old calculation skipped them, so the widths didn't line up with the columns.
+    """
+    df = pd.DataFrame([[1, "abc"], [-22, "d"]], columns=["a", "a"])
+
+    assert old_column_widths(df) == []
+    assert _get_column_widths(df).tolist() == [3, 3]
+
+
+@pytest.mark.parametrize(
+    "use_orjson, expected",
+    [
+        (True, '[null,null,"1.5","2024-01-01T00:00:00.000"]'),
+        (False, '[null, NaN, "1.5", "2024-01-01T00:00:00.000"]'),
+    ],
+)
+def test_dumps_json_default(monkeypatch, use_orjson, expected):
+    """Test the cells orjson can't encode natively are serialized by the hook."""
+    if use_orjson and backend.orjson is None:
+        pytest.skip("orjson is not installed")
+    if not use_orjson:
+        monkeypatch.setattr(backend, "orjson", None)
+    data = [pd.NA, float("nan"), Decimal("1.5"), pd.Timestamp("2024-01-01")]
+
+    assert _dumps_json(data) == expected
+
+
+@pytest.mark.parametrize(
+    "df",
+    [
+        pd.DataFrame({"n": [1, -2, 3]}),
+        pd.DataFrame({"x": [1.5, float("nan"), -2.25]}),
+        pd.DataFrame({"s": ["a", None, "c"]}),
+        pd.DataFrame({"flag": [True, False, True]}),
+        pd.DataFrame({"d": pd.to_datetime(["2024-01-01 12:30:01.123456", None])}),
+        pd.DataFrame(
+            {
+                "d": pd.to_datetime(["2024-01-01", "2024-06-01"]).tz_localize(
+                    "US/Eastern"
+                )
+            }
+        ),
+        pd.DataFrame({"d": pd.Series([pd.NaT, pd.NaT], dtype="datetime64[ns]")}),
+        pd.DataFrame({"d": [date(2024, 1, 1), None, date(2024, 1, 3)]}),
+        pd.DataFrame({"d": [datetime(2024, 1, 1, 12, 30, 1, 123456), "x"]}),
+        pd.DataFrame(
+            {"d": [date(2024, 1, 1), pd.Timestamp("2024-02-01 05:00", tz="UTC")]}
+        ),
+        pd.DataFrame({"d": [date(2024, 1, 1), date(1, 1, 1)]}),
+        pd.DataFrame({"d": [date(2024, 1, 1), datetime(2024, 2, 1, 5)]}),
+        pd.DataFrame({"td": pd.to_timedelta([1, 2], unit="D")}),
+        pd.DataFrame({"td": pd.to_timedelta(["1.5s", None]), "n": [1, 2]}),
+        pd.DataFrame(
+            {
+                "td": pd.to_timedelta(
+                    ["1us", "1.123456789s", "-1 days 2h", "3 days 04:05:06.007"]
+                )
+            }
+        ),
+        pd.DataFrame(
+            {"n": [1, 2]},
+            index=pd.TimedeltaIndex(pd.to_timedelta([1, 2], unit="h"), name="td"),
+        ),
+        pd.DataFrame({"d": [datetime(2024, 1, 1, 12, tzinfo=timezone.utc), "x"]}),
+        pd.DataFrame(
+            {"close": [1.0, 2.0]},
+            index=pd.DatetimeIndex(["2024-01-01", "2024-01-02"], name="date"),
+        ),
+        pd.DataFrame(
+            {"close": [1.0, 2.0]},
+            index=pd.Index([date(2024, 1, 1), date(2024, 1, 2)], name="date"),
+        ),
+        pd.DataFrame(
+            {
+                "date": [date(2024, 1, 1), date(2024, 1, 2)],
+                "open": [1.5, float("nan")],
+                "volume": [100, 200],
+                "symbol": ["AAPL", None],
+                "adjusted": [True, False],
+            }
+        ),
+    ],
+)
+def test_get_table_split(df):
+    """Test the table json matches the pandas split orient with iso dates."""
+    if backend.orjson is None:
+        pytest.skip("orjson is not installed")
+
+    expected = json.loads(df.to_json(orient="split", date_format="iso"))
+    assert json.loads(_dumps_json(_get_table_split(df))) == expected
+
+
+def figures() -> list:
+    """Get figures with the values plotly has to convert when encoding."""
+    dates = pd.date_range("2024-01-01", periods=4, freq="D")
+    candles = go.Figure(
+        go.Candlestick(
+            x=dates,
+            open=np.array([1.0, 2.0, np.nan, 4.0]),
+            high=np.array([2.0, 3.0, 4.0, 5.0]),
+            low=np.array([0.5, 1.5, 2.5, 3.5]),
+            close=np.array([1.5, 2.5, 3.5, np.nan]),
+        ),
+        layout=dict(title="<b>Candles</b>", height=600),
+    )
+    candles.add_scatter(
+        x=[day.to_pydatetime() for day in dates], y=np.arange(4), uid="volume"
+    )
+
+    animated = go.Figure(
+        data=[go.Scatter(x=np.arange(3), y=np.array([1, 2, 3]))],
+        frames=[
+            go.Frame(data=[go.Scatter(y=np.array([i, np.nan, i]))], name=str(i))
+            for i in range(3)
+        ],
+    )
+    return [candles, animated, go.Figure()]
+
+
+@pytest.mark.parametrize("engine", ["json", "orjson"])
+@pytest.mark.parametrize("fig", figures())
+def test_get_figure_dict(fig, engine):
+    """Test the figure payload matches fig.to_json() and leaves the figure as is.
+
+    _get_figure_dict reads plotly's private figure internals, so this fails
+    when a plotly upgrade changes them.
+    """
+    if engine == "orjson" and backend.orjson is None:
+        pytest.skip("orjson is not installed")
+    paper_bgcolor = "rgba(0,0,0,0)"
+    before = fig.to_json()
+
+    expected = json.loads(before)
+    expected["layout"]["paper_bgcolor"] = paper_bgcolor
+    payload = pio.json.to_json_plotly(
+        _get_figure_dict(fig, paper_bgcolor), engine=engine
+    )
+
+    assert json.loads(payload) == expected
+    assert fig.to_json() == before
+
+
+def plotly_js_app(mode: str, requests: list) -> web.Application:
+    """Serve PLOTLY_JS, misbehaving in the given mode.
+
+    The Range header of every GET is recorded in requests, None for a plain GET.
+    """
+
+    async def head(_request):
+        if mode == "missing":
+            return web.Response(status=404)
+        headers = {}
+        if mode != "no_accept_ranges":
+            headers["Accept-Ranges"] = "bytes"
+        if mode != "no_length":
+            headers["Content-Length"] = str(len(PLOTLY_JS))
+        return web.Response(headers=headers)
+
+    async def get(request):
+        range_header = request.headers.get("Range")
+        requests.append(range_header)
+        if mode == "missing":
+            return web.Response(status=404)
+        if range_header is None or mode == "ignore_range":
+            return web.Response(body=PLOTLY_JS)
+
+        start, end = map(int, range_header[len("bytes=") :].split("-"))
+        if mode == "short_range":
+            end -= 1
+        elif mode == "long_range":
+            end += 1
+        return web.Response(status=206, body=PLOTLY_JS[start : end + 1])
+
+    app = web.Application()
+    app.router.add_route("HEAD", "/plotly.min.js", head)
+    app.router.add_get("/plotly.min.js", get, allow_head=False)
+    return app
+
+
+@pytest.fixture()
+def plotly_js_path(tmp_path, monkeypatch):
+    """Download plotly.js into tmp_path instead of the assets folder."""
+    # the download started on import must be done before we redirect it
+    backend._DOWNLOAD_EVENT.wait(timeout=backend.DOWNLOAD_TIMEOUT)
+    path = tmp_path / backend.PLOTLYJS_PATH.name
+    monkeypatch.setattr(backend, "PLOTLYJS_PATH", path)
+    return path
+
+
+async def download_plotly_js(mode: str, monkeypatch) -> list:
+    """Download plotly.js from a local server and get the requests it made."""
+    requests: list = []
+    async with TestServer(plotly_js_app(mode, requests)) as server:
+        url = str(server.make_url("/plotly.min.js"))
+        monkeypatch.setattr(backend, "PLOTLYJS_URL", url)
+        await backend.download_plotly_js()
+    return requests
+
+
+def assert_no_partial_files(path):
+    """Assert the temporary download file was cleaned up."""
+    assert not list(path.parent.glob(".*.part"))
+
+
+@pytest.mark.asyncio
+async def test_download_plotly_js_ranges(plotly_js_path, monkeypatch):
+    """Test plotly.js is downloaded in parallel ranges."""
+    old_version = plotly_js_path.with_name("plotly-1.0.0.min.js")
+    old_version.write_text("old")
+
+    requests = await download_plotly_js("ranges", monkeypatch)
+
+    assert plotly_js_path.read_bytes() == PLOTLY_JS
+    assert len(requests) == backend.DOWNLOAD_PARTS
+    assert None not in requests
+    assert not old_version.exists()
+    assert_no_partial_files(plotly_js_path)
+
+
+@pytest.mark.parametrize("mode", ["ignore_range", "short_range", "long_range"])
+@pytest.mark.asyncio
+async def test_download_plotly_js_bad_ranges(plotly_js_path, monkeypatch, mode):
+    """Test a bad range response falls back to a single stream."""
+    requests = await download_plotly_js(mode, monkeypatch)
+
+    assert plotly_js_path.read_bytes() == PLOTLY_JS
+    assert requests[-1] is None
+    assert any(requests[:-1])
+    assert_no_partial_files(plotly_js_path)
+
+
+@pytest.mark.parametrize("mode", ["no_accept_ranges", "no_length"])
+@pytest.mark.asyncio
+async def test_download_plotly_js_no_ranges(plotly_js_path, monkeypatch, mode):
+    """Test servers without range support are downloaded in a single stream."""
+    requests = await download_plotly_js(mode, monkeypatch)
+
+    assert plotly_js_path.read_bytes() == PLOTLY_JS
+    assert requests == [None]
+    assert_no_partial_files(plotly_js_path)
+
+
+@pytest.mark.asyncio
+async def test_download_plotly_js_range_timeout(plotly_js_path, monkeypatch):
+    """Test a stalled range falls back to a single stream."""
+
+    async def stalled_range(*_args):
+        raise asyncio.TimeoutError
+
+    monkeypatch.setattr(backend, "_download_range", stalled_range)
+    requests = await download_plotly_js("ranges", monkeypatch)
+
+    assert plotly_js_path.read_bytes() == PLOTLY_JS
+    assert requests == [None]
+    assert_no_partial_files(plotly_js_path)
+
+
+@pytest.mark.asyncio
+async def test_download_plotly_js_error(plotly_js_path, monkeypatch):
+    """Test a failed download leaves no plotly.js behind."""
+    with pytest.warns(UserWarning, match="Error downloading plotly.js"):
+        await download_plotly_js("missing", monkeypatch)
+
+    assert not plotly_js_path.exists()
+    assert_no_partial_files(plotly_js_path)
@@ -0,0 +1,173 @@
+"""Test the charting core file watcher."""
+
+import asyncio
+import os
+import select
+import sys
+
+import pytest
+from openbb_charting.core import file_watcher
+
+# pylint: disable=redefined-outer-name
+
+requires_notifications = pytest.mark.skipif(
+    not (sys.platform.startswith("linux") or hasattr(select, "kqueue")),
+    reason="Directory notifications need inotify or kqueue",
+)
+
+
+@pytest.fixture()
+def watchers(monkeypatch):
+    """Record the watchers created by wait_for_file."""
+    created = []
+
+    class RecordingWatcher(file_watcher.DirectoryWatcher):
+        """Directory watcher that remembers its fd and counts its wakeups."""
+
+        def __init__(self, directory):
+            """Start watching the directory."""
+            super().__init__(directory)
+            self.watched_fd = self.fileno()
+            self.drains = 0
+            created.append(self)
+
+        def drain(self):
+            """Consume the pending notifications."""
+            self.drains += 1
+            super().drain()
+
+    monkeypatch.setattr(file_watcher, "DirectoryWatcher", RecordingWatcher)
+    return created
+
+
+@pytest.fixture()
+def poll_calls(monkeypatch):
+    """Record the calls falling back to poll_for_file."""
+    calls = []
+    poll_for_file = file_watcher.poll_for_file
+
+    async def recording_poll_for_file(file_path, timeout=10.0):
+        calls.append(file_path)
+        return await poll_for_file(file_path, timeout)
+
+    monkeypatch.setattr(file_watcher, "poll_for_file", recording_poll_for_file)
+    return calls
+
+
+def assert_closed(watcher):
+    """Assert the watcher released its file descriptor."""
+    assert watcher.fileno() == -1
+    with pytest.raises(OSError):
+        os.fstat(watcher.watched_fd)
+
+
+async def create_later(action, delay=0.1):
+    """Run the action after the wait has started."""
+    await asyncio.sleep(delay)
+    action()
+
+
+@requires_notifications
+@pytest.mark.asyncio
+async def test_wait_for_file_created(tmp_path, watchers, poll_calls):
+    """Test a file created after the wait starts is found."""
+    image = tmp_path / "chart.png"
+
+    found, _ = await asyncio.gather(
+        file_watcher.wait_for_file(image, timeout=5),
+        create_later(lambda: image.write_bytes(b"png")),
+    )
+
+    assert found
+    assert not poll_calls
+    assert len(watchers) == 1
+    assert watchers[0].drains >= 1
+    assert_closed(watchers[0])
+
+
+@requires_notifications
+@pytest.mark.asyncio
+async def test_wait_for_file_moved_in(tmp_path, watchers, poll_calls):
+    """Test a file renamed into the directory is found."""
+    export_dir = tmp_path / "exports"
+    export_dir.mkdir()
+    image = export_dir / "chart.png"
+    partial = tmp_path / "chart.png.part"
+    partial.write_bytes(b"png")
+
+    found, _ = await asyncio.gather(
+        file_watcher.wait_for_file(image, timeout=5),
+        create_later(lambda: os.replace(partial, image)),
+    )
+
+    assert found
+    assert not poll_calls
+    assert watchers[0].drains >= 1
+    assert_closed(watchers[0])
+
+
+@requires_notifications
+@pytest.mark.asyncio
+async def test_wait_for_file_ignores_other_entries(tmp_path, watchers):
+    """Test a new entry with another name wakes the wait but doesn't end it."""
+    image = tmp_path / "chart.png"
+
+    found, _ = await asyncio.gather(
+        file_watcher.wait_for_file(image, timeout=0.5),
+        create_later(lambda: (tmp_path / "other.png").write_bytes(b"png")),
+    )
+
+    assert not found
+    assert watchers[0].drains >= 1
+    assert_closed(watchers[0])
+
+
+@requires_notifications
+@pytest.mark.asyncio
+async def test_wait_for_file_timeout(tmp_path, watchers):
+    """Test the wait gives up once the timeout expires."""
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+
+    assert not await file_watcher.wait_for_file(tmp_path / "chart.png", timeout=0.3)
+    assert loop.time() - start >= 0.3
+    assert_closed(watchers[0])
+
+
+@pytest.mark.asyncio
+async def test_wait_for_file_existing(tmp_path, watchers):
+    """Test an existing file is found straight away."""
+    image = tmp_path / "chart.png"
+    image.write_bytes(b"png")
+
+    assert await file_watcher.wait_for_file(image, timeout=5)
+    for watcher in watchers:
+        assert_closed(watcher)
+
+
+@pytest.mark.asyncio
+async def test_wait_for_file_missing_directory(tmp_path, poll_calls):
+    """Test a missing directory falls back to polling."""
+    image = tmp_path / "missing" / "chart.png"
+
+    assert not await file_watcher.wait_for_file(image, timeout=0.2)
+    assert poll_calls == [image]
+
+
+@pytest.mark.asyncio
+async def test_wait_for_file_unsupported_platform(tmp_path, monkeypatch, poll_calls):
+    """Test platforms without notifications fall back to polling."""
+    monkeypatch.setattr(file_watcher.sys, "platform", "win32")
+    monkeypatch.delattr(file_watcher.select, "kqueue", raising=False)
+    image = tmp_path / "chart.png"
+
+    with pytest.raises(OSError):
+        file_watcher.DirectoryWatcher(tmp_path)
+
+    found, _ = await asyncio.gather(
+        file_watcher.wait_for_file(image, timeout=5),
+        create_later(lambda: image.write_bytes(b"png")),
+    )
+
+    assert found
+    assert poll_calls == [image]
@@ -21,7 +21,10 @@ from openbb_intrinio.models.etf_price_performance import (
     IntrinioEtfPricePerformanceFetcher,
 )
 from openbb_intrinio.models.etf_search import IntrinioEtfSearchFetcher
-from openbb_intrinio.models.financial_ratios import IntrinioFinancialRatiosFetcher
+from openbb_intrinio.models.financial_ratios import (
+    IntrinioFinancialRatiosFetcher,
+    IntrinioFinancialRatiosQueryParams,
+)
 from openbb_intrinio.models.forward_ebitda_estimates import (
     IntrinioForwardEbitdaEstimatesFetcher,
 )
@@ -418,6 +421,12 @@ def test_intrinio_financial_ratios_fetcher(credentials=test_credentials):
     assert result is None
 
 
+def test_intrinio_financial_ratios_symbol():
+    """Test the symbol is uppercased before the dash is replaced."""
+    params = IntrinioFinancialRatiosQueryParams(symbol="brk-b")
+    assert params.symbol == "BRK.B"
+
+
 @pytest.mark.record_http
 def test_intrinio_reported_financials_fetcher(credentials=test_credentials):
     """Test reported financials fetcher."""